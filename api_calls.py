@@ -66,14 +66,14 @@ def get_batch_ids(client: Optional[NomadClient] = None,
         client = get_client(url, token)
     
     query = {
-        'required': {'data': '*'},
+        'required': {'data': {'lab_id': '*'}},
         'owner': 'visible',
         'query': {'entry_type': batch_type},
         'pagination': {'page_size': 10000}
     }
     
     data = client.query_entries(query)
-    return [d["archive"]["data"]["lab_id"] for d in data if "lab_id" in d["archive"]["data"]]
+    return [d["archive"]["data"]["lab_id"] for d in data if "lab_id" in d["archive"].get("data", {})]
 
 
 def get_ids_in_batch(client: Optional[NomadClient] = None, 
@@ -100,7 +100,7 @@ def get_ids_in_batch(client: Optional[NomadClient] = None,
         client = get_client(url, token)
     
     query = {
-        'required': {'data': '*'},
+        'required': {'data': {'entities': {'lab_id': '*'}}},
         'owner': 'visible',
         'query': {'results.eln.lab_ids:any': batch_ids, 'entry_type': batch_type},
         'pagination': {'page_size': 100}
@@ -109,9 +109,9 @@ def get_ids_in_batch(client: Optional[NomadClient] = None,
     data = client.query_entries(query)
     sample_ids = []
     for d in data:
-        dd = d["archive"]["data"]
+        dd = d["archive"].get("data", {})
         if "entities" in dd:
-            sample_ids.extend([s["lab_id"] for s in dd["entities"]])
+            sample_ids.extend([s["lab_id"] for s in dd["entities"] if "lab_id" in s])
     return sample_ids
 
 
@@ -137,11 +137,11 @@ def get_uploads_by_author(client: Optional[NomadClient] = None,
         client = get_client(url, token)
     
     query = {
-        'required': {'data': '*'},
+        'required': {'data': {'lab_id': '*'}},
         'owner': 'visible',
         'query': {'authors': author},
         'pagination': {'page_size': 10000}
     }
     
     data = client.query_entries(query)
-    return [d["archive"]["data"]["lab_id"] for d in data if "lab_id" in d["archive"]["data"]]
+    return [d["archive"]["data"]["lab_id"] for d in data if "lab_id" in d["archive"].get("data", {})]
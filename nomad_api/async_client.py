@@ -0,0 +1,140 @@
+"""
+NOMAD API Async Client Module
+
+This module provides an asyncio-based client for interacting with NOMAD API endpoints.
+It requires the optional httpx package; HTTP/2 is used when the h2 package is installed.
+"""
+import asyncio
+import json
+import random
+from typing import Dict, Union, Any
+
+from urllib3.util.retry import Retry
+
+from nomad_api.client import READ_ONLY_POST_ENDPOINTS, RETRY_STATUS_CODES, encode_json_payload, json_loads
+
+# Try to import httpx for async HTTP support
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# HTTP/2 multiplexing in httpx needs the h2 package
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class AsyncNomadClient:
+    """Asynchronous client for interacting with the NOMAD API."""
+
+    # Number of retries for rate-limited or unavailable responses
+    MAX_RETRIES = 5
+    # Longest wait in seconds before a retry, also when the server asks for a longer one
+    MAX_RETRY_DELAY = 30
+
+    def __init__(self, base_url: str, token: str, max_connections: int = 64):
+        """
+        Initialize the asynchronous NOMAD API client.
+
+        Args:
+            base_url: The base URL for the NOMAD API
+            token: Authentication token
+            max_connections: Maximum number of concurrent connections
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("AsyncNomadClient requires httpx. Install it with 'pip install httpx[http2]'")
+
+        self.base_url = base_url
+        self.token = token
+        # Base URL with a single trailing slash, endpoints are appended to it
+        self._base = base_url.rstrip('/') + '/'
+        self.headers = {'Authorization': f'Bearer {token}'}
+        self.client = httpx.AsyncClient(
+            headers=self.headers,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=max_connections)
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> 'AsyncNomadClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def make_request(self, method: str, endpoint: str, params: Dict = None,
+                           json_data: Union[Dict, bytes] = None, timeout: int = 10) -> Any:
+        """
+        Make an API request to a NOMAD endpoint.
+
+        Args:
+            method: HTTP method (get, post, delete, etc.)
+            endpoint: API endpoint path (without base_url)
+            params: Query parameters
+            json_data: JSON payload for POST/PUT requests, or its pre-serialized bytes
+            timeout: Request timeout in seconds
+
+        Returns:
+            Response data as dictionary or None
+
+        Raises:
+            ConnectionError: If the request fails
+        """
+        url = self._base + endpoint.lstrip('/')
+        # Like NomadClient, only idempotent requests and read-only queries are resent; POSTs
+        # such as group creation could otherwise be applied twice
+        max_retries = self.MAX_RETRIES if (
+            method.upper() in Retry.DEFAULT_ALLOWED_METHODS or endpoint.strip('/') in READ_ONLY_POST_ENDPOINTS
+        ) else 0
+
+        try:
+            content = encode_json_payload(json_data)
+            for attempt in range(max_retries + 1):
+                response = await self.client.request(
+                    method.upper(),
+                    url,
+                    params=params,
+                    content=content,
+                    headers={'Content-Type': 'application/json'} if json_data is not None else None,
+                    timeout=timeout
+                )
+                if response.status_code not in RETRY_STATUS_CODES or attempt == max_retries:
+                    break
+                await asyncio.sleep(self._retry_delay(response, attempt))
+            response.raise_for_status()
+
+            # Return JSON data if there is a response body, otherwise None
+            if response.content:
+                return json_loads(response.content)
+            return None
+
+        except httpx.HTTPStatusError as e:
+            try:
+                error_detail = e.response.json().get('detail', e.response.text)
+                if isinstance(error_detail, list):
+                    error_message = f"API Error ({e.response.status_code}): {json.dumps(error_detail)}"
+                else:
+                    error_message = f"API Error ({e.response.status_code}): {error_detail or e.response.text}"
+            except json.JSONDecodeError:
+                error_message = f"API Error ({e.response.status_code}): {e.response.text}"
+            raise ConnectionError(error_message) from e
+        except httpx.HTTPError as e:
+            raise ConnectionError(f"API request failed: {e}") from e
+
+    @classmethod
+    def _retry_delay(cls, response: 'httpx.Response', attempt: int) -> float:
+        """Seconds to wait before retrying, honouring a Retry-After header in seconds up to MAX_RETRY_DELAY."""
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return min(float(retry_after), cls.MAX_RETRY_DELAY)
+        return min(0.5 * 2 ** attempt + random.random(), cls.MAX_RETRY_DELAY)
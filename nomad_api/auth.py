@@ -4,11 +4,14 @@ NOMAD API Authentication Module
 This module handles authentication with NOMAD API endpoints.
 """
 import os
+import time
 import requests
 import json
 from typing import Dict, Optional, Union, Any, List, Tuple
 from pathlib import Path
 
+from nomad_api.client import json_loads
+
 # Try to import dotenv for environment file support
 try:
     from dotenv import load_dotenv
@@ -21,6 +24,13 @@ if DOTENV_AVAILABLE:
     env_path = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) / '.env'
     load_dotenv(dotenv_path=env_path)
 
+# Shared session so repeated authentication calls reuse connections
+_AUTH_SESSION = requests.Session()
+
+# Successful token verifications: (base_url, token) -> (timestamp, user_info)
+_VERIFY_CACHE: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+VERIFY_CACHE_TTL = 600  # seconds
+
 # Dictionary mapping user-friendly names to actual API URLs
 OASIS_OPTIONS = {
     "SE Oasis": "https://nomad-hzb-se.de/nomad-oasis/api/v1",
@@ -44,11 +54,11 @@ def get_token(url: str, username: str, password: str) -> str:
         ValueError: If authentication fails
     """
     try:
-        response = requests.get(
+        response = _AUTH_SESSION.get(
             f"{url}/auth/token", params=dict(username=username, password=password))
         response.raise_for_status()
         
-        token_data = response.json()
+        token_data = json_loads(response.content)
         if 'access_token' not in token_data:
             raise ValueError("Access token not found in response")
             
@@ -99,6 +109,9 @@ def verify_token(base_url: str, token: str) -> Dict[str, Any]:
     """
     Verify if a token is valid by making a request to the users/me endpoint.
     
+    Successful verifications are cached for VERIFY_CACHE_TTL seconds, so creating
+    several clients with the same token in one process only verifies it once.
+    
     Args:
         base_url: The base URL for the NOMAD API
         token: Authentication token to verify
@@ -109,12 +122,18 @@ def verify_token(base_url: str, token: str) -> Dict[str, Any]:
     Raises:
         ValueError: If token verification fails
     """
+    cached = _VERIFY_CACHE.get((base_url, token))
+    if cached is not None and time.monotonic() - cached[0] < VERIFY_CACHE_TTL:
+        return cached[1]
+    
     try:
         verify_url = f"{base_url}/users/me"
         headers = {'Authorization': f'Bearer {token}'}
-        response = requests.get(verify_url, headers=headers, timeout=10)
+        response = _AUTH_SESSION.get(verify_url, headers=headers, timeout=10)
         response.raise_for_status()
-        return response.json()
+        user_info = json_loads(response.content)
+        _VERIFY_CACHE[(base_url, token)] = (time.monotonic(), user_info)
+        return user_info
     except requests.exceptions.RequestException as e:
         error_message = f"Token verification failed: {e}"
         if hasattr(e, 'response') and e.response is not None:
@@ -5,12 +5,82 @@ This module provides a client for interacting with NOMAD API endpoints.
 """
 import requests
 import json
-from typing import Dict, Optional, Union, Any, List, Tuple, Callable
+import urllib3
+import urllib3.response
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterator, Optional, Union, Any, List, Tuple, Callable
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Response status codes worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# POST endpoints that only read data, so their requests can safely be sent again
+READ_ONLY_POST_ENDPOINTS = ('entries/query', 'entries/archive/query')
+
+# Retry back-off cap and jitter are only supported from urllib3 2 on
+URLLIB3_BACKOFF_OPTIONS = {'backoff_max': 30, 'backoff_jitter': 1.0} if int(urllib3.__version__.split('.')[0]) >= 2 else {}
+
+# Response encodings urllib3 can decode; requests only asks for gzip and deflate by default,
+# brotli and zstd are added when urllib3 found their optional decoders
+ACCEPT_ENCODINGS = ['gzip', 'deflate']
+if getattr(urllib3.response, 'brotli', None) is not None:
+    ACCEPT_ENCODINGS.append('br')
+if getattr(urllib3.response, 'HAS_ZSTD', False):
+    ACCEPT_ENCODINGS.append('zstd')
+
+# Try to import ijson for incremental parsing of large responses
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Errors raised while a streamed response body is read and parsed; ijson reads urllib3's
+# raw stream, so they are not wrapped by requests
+STREAM_READ_ERRORS = (urllib3.exceptions.HTTPError,) + ((ijson.JSONError,) if IJSON_AVAILABLE else ())
+
+# Try to import orjson for faster JSON (de)serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize data to JSON bytes, using orjson if available."""
+    if ORJSON_AVAILABLE:
+        # Also accept numpy scalars and arrays, e.g. values taken from a DataFrame
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data).encode('utf-8')
+
+
+def encode_json_payload(json_data: Union[Dict, bytes, None]) -> Optional[bytes]:
+    """Serialize a request payload, passing pre-serialized JSON bytes through unchanged."""
+    if json_data is None or isinstance(json_data, bytes):
+        return json_data
+    return json_dumps(json_data)
+
+
+def json_loads(content: Union[bytes, str]) -> Any:
+    """Deserialize JSON bytes or text, using orjson if available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
 
 
 class NomadClient:
     """Client for interacting with the NOMAD API."""
     
+    # Number of retries for failed connections and rate-limited or unavailable responses
+    MAX_RETRIES = 5
+    
+    # Maximum number of responses kept by cached_get
+    GET_CACHE_MAXSIZE = 10000
+    
     def __init__(self, base_url: str, token: str):
         """
         Initialize the NOMAD API client.
@@ -21,10 +91,57 @@ class NomadClient:
         """
         self.base_url = base_url
         self.token = token
+        # Base URL with a single trailing slash, endpoints are appended to it
+        self._base = base_url.rstrip('/') + '/'
         self.headers = {'Authorization': f'Bearer {token}'}
         
+        # Reuse connections across requests instead of opening one per call
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Ask for compressed responses in every encoding urllib3 can decode here
+        self.session.headers['Accept-Encoding'] = ', '.join(ACCEPT_ENCODINGS)
+        # Only idempotent methods are resent after a response or read error; POSTs such as
+        # group creation could otherwise be applied twice (failed connections are always retried)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64,
+                              max_retries=self._retry_policy(Retry.DEFAULT_ALLOWED_METHODS))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Read-only query endpoints are retried for POST as well
+        query_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64,
+                                    max_retries=self._retry_policy(frozenset(['GET', 'POST'])))
+        for endpoint in READ_ONLY_POST_ENDPOINTS:
+            self.session.mount(self._base + endpoint, query_adapter)
+        
+        # In-memory cache for idempotent GET requests: endpoint -> (timestamp, response)
+        self._get_cache: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._get_cache_lock = threading.Lock()
+        
+    def _retry_policy(self, allowed_methods: frozenset) -> Retry:
+        """Build the retry policy for failed connections and rate-limited or unavailable responses."""
+        return Retry(
+            total=self.MAX_RETRIES,
+            backoff_factor=0.5,
+            # Spread out the retries of concurrent requests that were rate limited together
+            **URLLIB3_BACKOFF_OPTIONS,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=allowed_methods,
+            respect_retry_after_header=True,
+            # Return the last response so its error details end up in the raised error
+            raise_on_status=False
+        )
+        
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self.session.close()
+        
+    def __enter__(self) -> 'NomadClient':
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+        
     def make_request(self, method: str, endpoint: str, params: Dict = None, 
-                    json_data: Dict = None, timeout: int = 10) -> Any:
+                    json_data: Union[Dict, bytes] = None, timeout: int = 10) -> Any:
         """
         Make an API request to a NOMAD endpoint.
         
@@ -32,7 +149,7 @@ class NomadClient:
             method: HTTP method (get, post, delete, etc.)
             endpoint: API endpoint path (without base_url)
             params: Query parameters
-            json_data: JSON payload for POST/PUT requests
+            json_data: JSON payload for POST/PUT requests, or its pre-serialized bytes
             timeout: Request timeout in seconds
             
         Returns:
@@ -41,39 +158,133 @@ class NomadClient:
         Raises:
             ConnectionError: If the request fails
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        url = self._base + endpoint.lstrip('/')
         
         try:
-            response = requests.request(
+            response = self.session.request(
                 method, 
                 url, 
-                headers=self.headers, 
                 params=params, 
-                json=json_data, 
+                data=encode_json_payload(json_data), 
+                headers={'Content-Type': 'application/json'} if json_data is not None else None, 
                 timeout=timeout
             )
             response.raise_for_status()
             
             # Return JSON data if there is a response body, otherwise None
-            if response.text:
-                return response.json()
+            if response.content:
+                return json_loads(response.content)
             return None
             
         except requests.exceptions.RequestException as e:
-            error_message = f"API request failed: {e}"
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_detail = e.response.json().get('detail', e.response.text)
-                    if isinstance(error_detail, list):
-                        error_message = f"API Error ({e.response.status_code}): {json.dumps(error_detail)}"
-                    else:
-                        error_message = f"API Error ({e.response.status_code}): {error_detail or e.response.text}"
-                except json.JSONDecodeError:
-                    error_message = f"API Error ({e.response.status_code}): {e.response.text}"
-            raise ConnectionError(error_message) from e
+            raise self._request_error(e) from e
         except Exception as e:
             raise Exception(f"Unexpected error during API request: {e}") from e
     
+    def make_request_stream(self, method: str, endpoint: str, items_path: str = 'data',
+                            params: Dict = None, json_data: Union[Dict, bytes] = None,
+                            timeout: int = 10) -> Iterator[Any]:
+        """
+        Make an API request and iterate over the items of an array in the response.
+        
+        With ijson installed the response is parsed incrementally while it is being
+        downloaded, so neither the raw body nor the rest of the response envelope is
+        held in memory. Without ijson the response is parsed as a whole.
+        
+        Args:
+            method: HTTP method (get, post, delete, etc.)
+            endpoint: API endpoint path (without base_url)
+            items_path: Dot-separated path of the array in the response (e.g. 'data')
+            params: Query parameters
+            json_data: JSON payload for POST/PUT requests, or its pre-serialized bytes
+            timeout: Request timeout in seconds
+            
+        Yields:
+            Items of the array at items_path
+            
+        Raises:
+            ConnectionError: If the request fails
+        """
+        url = self._base + endpoint.lstrip('/')
+        
+        try:
+            with self.session.request(
+                method, 
+                url, 
+                params=params, 
+                data=encode_json_payload(json_data), 
+                headers={'Content-Type': 'application/json'} if json_data is not None else None, 
+                timeout=timeout,
+                stream=True
+            ) as response:
+                try:
+                    response.raise_for_status()
+                except requests.exceptions.HTTPError as e:
+                    # Build the error while the streamed error body can still be read
+                    raise self._request_error(e) from e
+                
+                if IJSON_AVAILABLE:
+                    response.raw.decode_content = True
+                    yield from ijson.items(response.raw, f'{items_path}.item', use_float=True)
+                else:
+                    data = json_loads(response.content) if response.content else None
+                    for key in items_path.split('.'):
+                        data = (data or {}).get(key)
+                    yield from data or []
+                    
+        except requests.exceptions.RequestException as e:
+            raise self._request_error(e) from e
+        except STREAM_READ_ERRORS as e:
+            raise self._request_error(e) from e
+    
+    @staticmethod
+    def _request_error(e: Exception) -> ConnectionError:
+        """Build a ConnectionError with the API error details of a failed request."""
+        error_message = f"API request failed: {e}"
+        if hasattr(e, 'response') and e.response is not None:
+            try:
+                error_detail = e.response.json().get('detail', e.response.text)
+                if isinstance(error_detail, list):
+                    error_message = f"API Error ({e.response.status_code}): {json.dumps(error_detail)}"
+                else:
+                    error_message = f"API Error ({e.response.status_code}): {error_detail or e.response.text}"
+            except json.JSONDecodeError:
+                error_message = f"API Error ({e.response.status_code}): {e.response.text}"
+        return ConnectionError(error_message)
+    
+    def cached_get(self, endpoint: str, ttl: float = 300) -> Any:
+        """
+        Make a GET request, reusing a previous response for the same endpoint.
+        
+        Intended for metadata that rarely changes, such as uploads and users.
+        
+        Args:
+            endpoint: API endpoint path (without base_url)
+            ttl: Number of seconds a cached response stays valid
+            
+        Returns:
+            Response data as dictionary or None
+        """
+        with self._get_cache_lock:
+            cached = self._get_cache.get(endpoint)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                self._get_cache.move_to_end(endpoint)
+                return cached[1]
+        
+        response = self.make_request('get', endpoint)
+        
+        with self._get_cache_lock:
+            self._get_cache[endpoint] = (time.monotonic(), response)
+            self._get_cache.move_to_end(endpoint)
+            while len(self._get_cache) > self.GET_CACHE_MAXSIZE:
+                self._get_cache.popitem(last=False)
+        return response
+    
+    def clear_cache(self) -> None:
+        """Discard all responses cached by cached_get."""
+        with self._get_cache_lock:
+            self._get_cache.clear()
+    
     # User-related methods
     def get_user_info(self) -> Dict[str, Any]:
         """Get information about the authenticated user."""
@@ -130,7 +341,7 @@ class NomadClient:
         self.make_request('delete', f'groups/{group_id}')
     
     # Entry-related methods
-    def query_entries(self, query: Dict, page_size: int = 100) -> List[Dict[str, Any]]:
+    def query_entries(self, query: Dict, page_size: int = 1000) -> List[Dict[str, Any]]:
         """
         Query entries in NOMAD with advanced filtering.
         
@@ -4,137 +4,416 @@ NOMAD API Data Retrieval Module
 This module provides higher-level functions for retrieving and processing data from the NOMAD API.
 It builds on the client.py module to provide specific data retrieval functions.
 """
-from typing import Dict, List, Optional, Any
+import asyncio
+import itertools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple, Union, Any
+
+from nomad_api.async_client import AsyncNomadClient
+from nomad_api.client import NomadClient, json_dumps
+
+# Upload-level metadata fields that are also available in an entry's archive metadata
+ARCHIVE_METADATA_FIELDS = (
+    'main_author', 'coauthors', 'coauthor_groups', 'upload_create_time',
+    'published', 'license', 'upload_name',
+)
+
+def _samples_query_payload(access_level: str, section_type: str, page_size: int) -> Dict[str, Any]:
+    """Build the archive query payload for the first page of samples"""
+    return {
+        "owner": access_level,
+        "query": {
+            "and": [
+                {"results.eln.sections:any": [section_type]},
+                {"quantities:all": ["data"]},
+            ]
+        },
+        "required": {
+            "metadata": {field: "*" for field in ARCHIVE_METADATA_FIELDS},
+            "data": {"lab_id": "*"}
+        },
+        "pagination": {
+            "page_size": page_size,
+            "order_by": "entry_id",
+            "order": "asc"
+        }
+    }
+
+
+def _first_page_payloads(section_type: str, page_size: int, show_progress: bool) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield the access level and first-page query payload to try, admin access first
+    
+    The caller requests each payload in turn, passing request errors to
+    _access_level_failed, and stops at the first response with samples.
+    """
+    for access_level in ("admin", "visible"):
+        if show_progress:
+            print(f"Trying to retrieve samples with {access_level} access...")
+        yield access_level, _samples_query_payload(access_level, section_type, page_size)
+
+
+def _access_level_failed(access_level: str, error: Exception, show_progress: bool):
+    """Fall back from admin to visible access, or raise once visible access failed too"""
+    if access_level != "admin":
+        raise Exception(f"Failed to retrieve samples with both admin and visible access: {str(error)}")
+    if show_progress:
+        print("Admin access failed, falling back to visible access...")
+
+
+def _samples_pagination(response_entries: Optional[Dict[str, Any]], page_size: int,
+                        max_pages: Optional[int]) -> Tuple[int, int, int, int]:
+    """Work out the pages to fetch from the first page of a samples query
+    
+    The server may cap the page size, so the size it actually used is returned.
+    
+    Returns:
+        Tuple of page size, total number of entries, total number of pages and last page to fetch
+    """
+    if not response_entries:
+        raise Exception("Failed to retrieve any samples")
+    
+    page_size = response_entries.get('pagination', {}).get('page_size') or page_size
+    total_entries = response_entries.get('pagination', {}).get('total', 0)
+    total_pages = (total_entries + page_size - 1) // page_size
+    last_page = total_pages if max_pages is None else min(max_pages, total_pages)
+    return page_size, total_entries, total_pages, last_page
+
+
+def _paginated_payload(base_payload: bytes, pagination: Dict[str, Any]) -> bytes:
+    """Add a pagination object to a query payload serialized without one
+    
+    The invariant part of a query is serialized only once, and only the pagination
+    is serialized for every page.
+    """
+    return base_payload[:-1] + b',"pagination":' + json_dumps(pagination) + b'}'
+
+
+def _needs_upload_details(entry: Dict[str, Any]) -> bool:
+    """Check whether the author information of an entry must be fetched from its upload"""
+    return bool(entry.get('upload_id')) and 'main_author' not in entry.get('archive', {}).get('metadata', {})
+
+
+def _sample_from_entry(entry: Dict[str, Any], upload_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build the sample dictionary from an archive query entry
+    
+    Args:
+        entry: Entry returned by the entries/archive/query endpoint
+        upload_data: Upload details to use instead of the archive metadata
+        
+    Returns:
+        Dictionary with sample data and author information
+    """
+    archive = entry.get('archive', {})
+    
+    # Extract basic sample information
+    sample_info = {
+        'entry_id': entry.get('entry_id'),
+        'upload_id': entry.get('upload_id'),
+        'lab_id': archive.get('data', {}).get('lab_id')
+    }
+    
+    if entry.get('upload_id'):
+        if upload_data is None:
+            upload_data = archive['metadata']
+        
+        # Add author information
+        sample_info.update({
+            'main_author': upload_data.get('main_author'),
+            'coauthors': upload_data.get('coauthors', []),
+            'coauthor_groups': upload_data.get('coauthor_groups', []),
+            'upload_create_time': upload_data.get('upload_create_time'),
+            'published': upload_data.get('published', False),
+            'license': upload_data.get('license'),
+            'upload_name': upload_data.get('upload_name'),
+        })
+    
+    return sample_info
+
+
+def _iter_pages_of_samples(
+    client: NomadClient,
+    page_size: int,
+    max_pages: Optional[int],
+    section_type: str,
+    show_progress: bool,
+    max_workers: int
+) -> Iterator[Dict[str, Any]]:
+    """Retrieve samples page by page, prefetching the next page in the background
+    
+    See iter_samples_with_authors for the arguments.
+    """
+    sample_count = 0
+    page = 1
+    
+    # Query for samples (entries with specified section type), trying admin access first
+    response_entries = None
+    for access_level, query_payload in _first_page_payloads(section_type, page_size, show_progress):
+        try:
+            response_entries = client.make_request("post", "entries/archive/query", json_data=query_payload)
+        except Exception as e:
+            _access_level_failed(access_level, e, show_progress)
+            continue
+        if response_entries:
+            if show_progress:
+                print(f"Successfully retrieved samples with {access_level} access")
+            break
+    
+    page_size, total_entries, total_pages, last_page = _samples_pagination(response_entries, page_size, max_pages)
+    
+    if show_progress:
+        print("Retrieving samples with author information...")
+    
+    if show_progress:
+        print(f"Found {total_entries} samples (approximately {total_pages} pages)")
+        
+        if max_pages:
+            print(f"Limiting to {max_pages} pages ({min(max_pages * page_size, total_entries)} samples)")
+    
+    base_payload = json_dumps({key: value for key, value in query_payload.items() if key != 'pagination'})
+    
+    def fetch_page(page_after_value: str) -> List[Dict[str, Any]]:
+        payload = _paginated_payload(base_payload, {**query_payload['pagination'], 'page_after_value': page_after_value})
+        return list(client.make_request_stream("post", "entries/archive/query", json_data=payload))
+    
+    # Pages are requested with keyset pagination: entries are ordered by entry_id, so the
+    # cursor of the next page is the last entry_id of the current one. The next page is
+    # requested while the uploads of the current page are being fetched.
+    page_executor = ThreadPoolExecutor(max_workers=1)
+    upload_executor = ThreadPoolExecutor(max_workers=max_workers)
+    next_page_future = None
+    futures = {}
+    entries = response_entries.get('data', [])
+    try:
+        while entries and page <= last_page:
+            if page < last_page:
+                next_page_future = page_executor.submit(fetch_page, entries[-1]['entry_id'])
+            
+            # Fetch upload details concurrently for entries whose archive lacks author information,
+            # in the order of the entries so the first samples can be yielded as soon as possible
+            upload_ids = dict.fromkeys(entry['upload_id'] for entry in entries if _needs_upload_details(entry))
+            futures = {upload_id: upload_executor.submit(client.cached_get, f"uploads/{upload_id}")
+                       for upload_id in upload_ids}
+            
+            # Process entries in current page, each one as soon as its upload details arrived
+            for entry in entries:
+                try:
+                    upload_future = futures.get(entry.get('upload_id'))
+                    upload_data = upload_future.result().get('data', {}) if upload_future else None
+                    sample_info = _sample_from_entry(entry, upload_data)
+                except Exception as e:
+                    if show_progress:
+                        print(f"Error processing entry {entry.get('entry_id')}: {str(e)}")
+                    continue
+                
+                sample_count += 1
+                yield sample_info
+            
+            if show_progress:
+                print(f"Processed page {page}/{last_page}")
+            
+            if next_page_future is None:
+                break
+            entries = next_page_future.result()
+            next_page_future = None
+            page += 1
+    finally:
+        if next_page_future is not None:
+            next_page_future.cancel()
+        for upload_future in futures.values():
+            upload_future.cancel()
+        page_executor.shutdown(wait=False)
+        upload_executor.shutdown(wait=False)
+    
+    if show_progress:
+        print(f"Retrieved information for {sample_count} samples")
+
+
+def iter_samples_with_authors(
+    client: NomadClient, 
+    page_size: int = 500, 
+    max_pages: Optional[int] = None,
+    section_type: str = "HySprint_Sample",
+    show_progress: bool = True,
+    max_workers: int = 16
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over all samples with their author information
+    
+    The samples are retrieved by a background thread into a bounded queue, so the
+    server requests, the upload fan-out and the caller's processing all overlap.
+    Samples are queued as soon as the upload details they need have arrived. About
+    four pages of samples are held in memory at any time: two pages in the queue,
+    the page whose upload details are being fetched and the prefetched next page.
+    
+    Author information is read from the archive metadata returned by the
+    entries/archive/query endpoint. Upload details are only requested for
+    entries whose archive metadata does not contain it.
+    
+    Args:
+        client: NomadClient instance
+        page_size: Number of entries per page
+        max_pages: Maximum number of pages to retrieve (None for all)
+        section_type: Type of section to filter by in the query
+        show_progress: Whether to print progress information
+        max_workers: Number of upload details to fetch concurrently
+        
+    Yields:
+        Dictionaries with sample data and author information
+    """
+    samples = queue.Queue(maxsize=2 * page_size)
+    stop = threading.Event()
+    done = object()
+    
+    def put(item: Any) -> bool:
+        # Give up waiting for free space once the consumer has stopped iterating
+        while not stop.is_set():
+            try:
+                samples.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce() -> None:
+        pages = _iter_pages_of_samples(client, page_size, max_pages, section_type,
+                                       show_progress, max_workers)
+        try:
+            for sample in pages:
+                if not put(sample):
+                    return
+            put(done)
+        except Exception as e:
+            put(e)
+        finally:
+            pages.close()
+    
+    producer = threading.Thread(target=produce, name="nomad-samples-producer", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = samples.get()
+            if item is done:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
 
-from nomad_api.client import NomadClient
 
 def get_all_samples_with_authors(
     client: NomadClient, 
-    page_size: int = 100, 
+    page_size: int = 500, 
     max_pages: Optional[int] = None,
     section_type: str = "HySprint_Sample",
-    show_progress: bool = True
+    show_progress: bool = True,
+    max_workers: int = 16
 ) -> List[Dict[str, Any]]:
     """
     Retrieve all samples with their author information
     
+    See iter_samples_with_authors for a streaming variant.
+    
     Args:
         client: NomadClient instance
         page_size: Number of entries per page
         max_pages: Maximum number of pages to retrieve (None for all)
         section_type: Type of section to filter by in the query
         show_progress: Whether to print progress information
+        max_workers: Number of upload details to fetch concurrently
         
     Returns:
         List of dictionaries with sample data and author information
     """
-    samples_with_authors = []
-    page = 1
-    total_pages = float('inf')  # Will be updated after first query
+    return list(iter_samples_with_authors(
+        client, page_size=page_size, max_pages=max_pages, section_type=section_type,
+        show_progress=show_progress, max_workers=max_workers
+    ))
+
+
+async def aget_all_samples_with_authors(
+    client: AsyncNomadClient,
+    page_size: int = 500,
+    max_pages: Optional[int] = None,
+    section_type: str = "HySprint_Sample",
+    show_progress: bool = True,
+    max_concurrency: int = 64
+) -> List[Dict[str, Any]]:
+    """
+    Retrieve all samples with their author information using asyncio
     
-    # First try with admin access, then fall back to visible
-    access_levels = ["admin", "visible"]
+    After the first page, all remaining pages and then all missing upload details
+    are requested concurrently, bounded by max_concurrency in-flight requests.
+    Inside a running event loop (e.g. Jupyter) use ``await``, otherwise
+    ``asyncio.run(aget_all_samples_with_authors(...))``.
     
-    # Query for samples (entries with specified section type)
-    query_payload = None
-    response_entries = None
+    Args:
+        client: AsyncNomadClient instance
+        page_size: Number of entries per page
+        max_pages: Maximum number of pages to retrieve (None for all)
+        section_type: Type of section to filter by in the query
+        show_progress: Whether to print progress information
+        max_concurrency: Maximum number of concurrent requests
+        
+    Returns:
+        List of dictionaries with sample data and author information
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
     
-    for access_level in access_levels:
+    async def request(method: str, endpoint: str, json_data: Union[Dict, bytes] = None) -> Any:
+        async with semaphore:
+            return await client.make_request(method, endpoint, json_data=json_data)
+    
+    # First try with admin access, then fall back to visible
+    response_entries = None
+    for access_level, query_payload in _first_page_payloads(section_type, page_size, show_progress):
         try:
-            query_payload = {
-                "owner": access_level,
-                "query": {
-                    "and": [
-                        {"results.eln.sections:any": [section_type]},
-                        {"quantities:all": ["data"]},
-                    ]
-                },
-                "pagination": {
-                    "page_size": page_size,
-                    "page": page
-                }
-            }
-            
-            if show_progress:
-                print(f"Trying to retrieve samples with {access_level} access...")
-            
-            # Test query with current access level
-            response_entries = client.make_request("post", "entries/query", json_data=query_payload)
-            if response_entries:
-                if show_progress:
-                    print(f"Successfully retrieved samples with {access_level} access")
-                break
-                
+            response_entries = await request("post", "entries/archive/query", query_payload)
         except Exception as e:
-            if access_level == "admin":
-                if show_progress:
-                    print(f"Admin access failed, falling back to visible access...")
-                continue
-            else:
-                raise Exception(f"Failed to retrieve samples with both admin and visible access: {str(e)}")
+            _access_level_failed(access_level, e, show_progress)
+            continue
+        if response_entries:
+            if show_progress:
+                print(f"Successfully retrieved samples with {access_level} access")
+            break
     
-    if not response_entries:
-        raise Exception("Failed to retrieve any samples")
+    page_size, total_entries, total_pages, last_page = _samples_pagination(response_entries, page_size, max_pages)
     
     if show_progress:
-        print("Retrieving samples with author information...")
+        print(f"Found {total_entries} samples, fetching {last_page} pages...")
     
-    while page <= total_pages and (max_pages is None or page <= max_pages):
-        # Update pagination for the current page
-        query_payload['pagination']['page'] = page
-        
-        # Get entries for the current page
-        response_entries = client.make_request("post", "entries/query", json_data=query_payload)
-        
-        # Update total pages on first query
-        if page == 1:
-            total_entries = response_entries.get('pagination', {}).get('total', 0)
-            total_pages = (total_entries + page_size - 1) // page_size
-            
+    # Fetch the remaining pages concurrently; gather preserves page order
+    base_payload = json_dumps({key: value for key, value in query_payload.items() if key != 'pagination'})
+    responses = await asyncio.gather(*[
+        request("post", "entries/archive/query",
+                _paginated_payload(base_payload, {**query_payload['pagination'], 'page': page}))
+        for page in range(2, last_page + 1)
+    ])
+    entries = [entry for response in [response_entries, *responses] for entry in response.get('data', [])]
+    
+    # Fetch missing upload details concurrently
+    upload_ids = list({entry['upload_id'] for entry in entries if _needs_upload_details(entry)})
+    upload_responses = await asyncio.gather(
+        *[request("get", f"uploads/{upload_id}") for upload_id in upload_ids],
+        return_exceptions=True
+    )
+    upload_map = dict(zip(upload_ids, upload_responses))
+    
+    samples_with_authors = []
+    for entry in entries:
+        try:
+            upload_data = None
+            if entry.get('upload_id') in upload_map:
+                upload_response = upload_map[entry['upload_id']]
+                if isinstance(upload_response, Exception):
+                    raise upload_response
+                upload_data = upload_response.get('data', {})
+            samples_with_authors.append(_sample_from_entry(entry, upload_data))
+        except Exception as e:
             if show_progress:
-                print(f"Found {total_entries} samples (approximately {total_pages} pages)")
-                
-                if max_pages:
-                    print(f"Limiting to {max_pages} pages ({min(max_pages * page_size, total_entries)} samples)")
-        
-        entries = response_entries.get('data', [])
-        
-        # Process entries in current page
-        for entry in entries:
-            try:
-                # Extract basic sample information
-                sample_info = {
-                    'entry_id': entry.get('entry_id'),
-                    'upload_id': entry.get('upload_id'),
-                    'lab_id': entry.get('data', {}).get('lab_id')
-                }
-                
-                # Get details about the upload (which contains author information)
-                upload_id = entry.get('upload_id')
-                if upload_id:
-                    response_upload = client.make_request("get", f"uploads/{upload_id}")
-                    upload_data = response_upload.get('data', {})
-                    
-                    # Add author information
-                    sample_info.update({
-                        'main_author': upload_data.get('main_author'),
-                        'coauthors': upload_data.get('coauthors', []),
-                        'coauthor_groups': upload_data.get('coauthor_groups', []),
-                        'upload_create_time': upload_data.get('upload_create_time'),
-                        'published': upload_data.get('published', False),
-                        'license': upload_data.get('license'),
-                        'upload_name': upload_data.get('upload_name'),
-                    })
-                
-                samples_with_authors.append(sample_info)
-                
-            except Exception as e:
-                if show_progress:
-                    print(f"Error processing entry {entry.get('entry_id')}: {str(e)}")
-        
-        if show_progress:
-            print(f"Processed page {page}/{total_pages if max_pages is None else min(max_pages, total_pages)}")
-        page += 1
+                print(f"Error processing entry {entry.get('entry_id')}: {str(e)}")
     
     if show_progress:
         print(f"Retrieved information for {len(samples_with_authors)} samples")
@@ -153,7 +432,7 @@ def get_user_details(client: NomadClient, user_id: str) -> Optional[Dict[str, An
         User details dictionary or None if not found
     """
     try:
-        response = client.make_request('get', f'users/{user_id}')
+        response = client.cached_get(f'users/{user_id}')
         return response
     except Exception as e:
         print(f"Error getting user {user_id}: {str(e)}")
@@ -169,19 +448,85 @@ def get_all_unique_authors(samples: List[Dict[str, Any]]) -> set:
     Returns:
         Set of unique author IDs
     """
-    unique_authors = set()
+    main_authors = (sample.get('main_author') for sample in samples)
+    coauthors = itertools.chain.from_iterable(
+        sample.get('coauthors') if isinstance(sample.get('coauthors'), list) else ()
+        for sample in samples
+    )
+    return set(filter(None, itertools.chain(main_authors, coauthors)))
+
+
+def get_users_details(client: NomadClient, user_ids: List[str], chunk_size: int = 100,
+                      max_workers: int = 16) -> Dict[str, Dict[str, Any]]:
+    """Get detailed information about several users at once
     
-    # Add main authors
-    for sample in samples:
-        if 'main_author' in sample and sample['main_author']:
-            unique_authors.add(sample['main_author'])
-            
-        # Add coauthors
-        coauthors = sample.get('coauthors', [])
-        if isinstance(coauthors, list):
-            unique_authors.update([author for author in coauthors if author])
-            
-    return unique_authors
+    Users are requested in batches via the users endpoint's user_id filter. If the
+    server rejects the batched query, the users are fetched individually in parallel.
+    
+    Args:
+        client: NomadClient instance
+        user_ids: IDs of the users to retrieve
+        chunk_size: Number of user IDs per batched request
+        max_workers: Number of concurrent requests for the per-user fallback
+        
+    Returns:
+        Dictionary mapping user IDs to user details (users not found are omitted)
+    """
+    user_ids = [user_id for user_id in dict.fromkeys(user_ids) if user_id]
+    users = {}
+    
+    try:
+        for i in range(0, len(user_ids), chunk_size):
+            chunk = user_ids[i:i + chunk_size]
+            response = client.make_request('get', 'users', params=[('user_id', uid) for uid in chunk])
+            for user in (response or {}).get('data', []):
+                if user.get('user_id'):
+                    users[user['user_id']] = user
+        return users
+    except Exception:
+        pass
+    
+    # Batched lookup not supported, fall back to one request per user
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for user_id, user_details in zip(user_ids, executor.map(
+                lambda uid: get_user_details(client, uid), user_ids)):
+            if user_details:
+                users[user_id] = user_details
+    return users
+
+
+def list_uploads_by_id(client: NomadClient, upload_ids: List[str],
+                      chunk_size: int = 100) -> Dict[str, Dict[str, Any]]:
+    """List the details of several uploads at once
+    
+    Uploads are requested in batches via the uploads endpoint's upload_id filter. That
+    endpoint only lists uploads the authenticated user has access to as a member, so
+    uploads missing from the result have to be requested individually via uploads/{upload_id}.
+    
+    Args:
+        client: NomadClient instance
+        upload_ids: IDs of the uploads to retrieve
+        chunk_size: Number of upload IDs per batched request
+        
+    Returns:
+        Dictionary mapping upload IDs to upload details (uploads not listed are omitted)
+    """
+    upload_ids = [upload_id for upload_id in dict.fromkeys(upload_ids) if upload_id]
+    uploads = {}
+    
+    try:
+        for i in range(0, len(upload_ids), chunk_size):
+            chunk = upload_ids[i:i + chunk_size]
+            params = [('upload_id', uid) for uid in chunk] + [('page_size', len(chunk))]
+            response = client.make_request('get', 'uploads', params=params)
+            for upload in (response or {}).get('data', []):
+                if upload.get('upload_id'):
+                    uploads[upload['upload_id']] = upload
+    except Exception:
+        # Batched lookup not supported; the failure is tolerated and the uploads listed so far
+        # are returned, the remaining ones have to be fetched individually by the caller
+        pass
+    return uploads
 
 
 def create_author_name_map(client: NomadClient, samples: List[Dict[str, Any]]) -> Dict[str, str]:
@@ -197,15 +542,8 @@ def create_author_name_map(client: NomadClient, samples: List[Dict[str, Any]]) -
     # Get all unique author IDs
     unique_authors = get_all_unique_authors(samples)
     
-    # Create a dictionary to store user details
-    user_cache = {}
-    
-    # Get user details for each unique author
-    for user_id in unique_authors:
-        if user_id and user_id not in user_cache:
-            user_details = get_user_details(client, user_id)
-            if user_details:
-                user_cache[user_id] = user_details
+    # Get user details for all unique authors
+    user_cache = get_users_details(client, list(unique_authors))
     
     # Create mapping from user ID to name
     user_id_to_name = {}
@@ -6,13 +6,35 @@ specifically focused on HySprint samples.
 """
 
 import pandas as pd
-import json
+import csv
+import itertools
 import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Tuple, Union, Any
 from tqdm.notebook import tqdm  # For nice progress bars in notebooks
 from pathlib import Path
 
+from nomad_api.client import json_dumps, json_loads
+from nomad_api.data import get_users_details, list_uploads_by_id
+
+# Try to import pyarrow for caching DataFrames as Feather files
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Try to import zstandard for compressing cached data
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
 # Cache configuration
 CACHE_DIR = Path('.nomad_cache')
 CACHE_CONFIG = {
@@ -21,76 +43,228 @@ CACHE_CONFIG = {
     'uploads': {'expire_hours': 48}    # Cache upload details for 48 hours
 }
 
+# All cached items live in one SQLite database instead of one JSON file per item
+CACHE_DB = CACHE_DIR / 'cache.sqlite'
+
+# SQLite connections can't be shared between threads, so each thread opens its own
+_cache_connections = threading.local()
+
+# Cached payloads of at least this many bytes are stored zstd-compressed, if available
+CACHE_COMPRESS_MIN_SIZE = 1024
+
+# Magic number at the start of every zstd frame, distinguishing compressed payloads
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Number of keys looked up per query by load_many_from_cache, below SQLite's parameter limit
+CACHE_QUERY_CHUNK_SIZE = 500
+
+# Errors of unreadable or corrupt cached data, which load_from_cache treats as a cache miss
+CACHE_READ_ERRORS = (sqlite3.Error, ValueError) + ((zstandard.ZstdError,) if ZSTD_AVAILABLE else ())
+
+# In-memory copy of user details in front of the 'users' disk cache, so authors
+# that recur across get_hysprint_data calls are resolved without file access:
+# user_id -> (timestamp, user details), in least recently used order
+_user_details_cache: 'OrderedDict[str, Tuple[datetime, Dict[str, Any]]]' = OrderedDict()
+
+# Same for upload details in front of the 'uploads' disk cache:
+# upload_id -> (timestamp, upload details)
+_upload_details_cache: 'OrderedDict[str, Tuple[datetime, Dict[str, Any]]]' = OrderedDict()
+
+# Maximum number of items in each in-memory details cache; the least recently used are evicted
+DETAILS_CACHE_MAXSIZE = 4096
+_details_cache_lock = threading.Lock()
+
+# Number of concurrent API requests; stays below the connection pool size of
+# NomadClient's session (pool_maxsize=64) so every worker reuses a kept-alive connection
+MAX_WORKERS = 16
+
+# Number of entries per entries/query page; deployments rejecting it get FALLBACK_PAGE_SIZE
+PAGE_SIZE = 1000
+FALLBACK_PAGE_SIZE = 100
+
+# Entry fields used for the HySprint samples DataFrame, mapped to their column names
+ENTRY_FIELDS = {
+    'upload_id': 'upload_id',
+    'data.name': 'sample_name',
+    'data.lab_id': 'lab_id',
+    'results.properties.optoelectronic.solar_cell.cell_area': 'cell_area',
+    'results.properties.optoelectronic.solar_cell.efficiency': 'efficiency',
+}
+
+# Columns of the attribution overrides file
+ATTRIBUTION_COLUMNS = ('upload_id', 'author_id', 'author_display_name', 'override_date')
+
+# Columns of the HySprint samples DataFrame
+SAMPLE_COLUMNS = ('upload_id', 'upload_name', 'sample_name', 'lab_id', 'upload_date',
+                  'main_author_id', 'main_author', 'cell_area', 'efficiency')
+
 def ensure_cache_dir():
     """Create cache directory if it doesn't exist"""
     CACHE_DIR.mkdir(exist_ok=True)
-    for cache_type in CACHE_CONFIG.keys():
-        (CACHE_DIR / cache_type).mkdir(exist_ok=True)
 
-def get_cache_path(cache_type: str, key: str) -> Path:
-    """Get the path for a cached item"""
-    return CACHE_DIR / cache_type / f"{key}.json"
+def get_cache_connection() -> sqlite3.Connection:
+    """Get this thread's connection to the cache database, creating the database if needed"""
+    connection = getattr(_cache_connections, 'connection', None)
+    if connection is None:
+        ensure_cache_dir()
+        connection = sqlite3.connect(CACHE_DB, timeout=30)
+        # Let readers and writers in other threads work concurrently
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "type TEXT, key TEXT, timestamp REAL, data BLOB, PRIMARY KEY (type, key))"
+        )
+        _cache_connections.connection = connection
+    return connection
+
+def _encode_cache_data(data: Any) -> bytes:
+    """Serialize data for the cache, compressing large payloads if zstandard is available"""
+    content = json_dumps(data)
+    if ZSTD_AVAILABLE and len(content) >= CACHE_COMPRESS_MIN_SIZE:
+        content = zstandard.ZstdCompressor(level=3).compress(content)
+    return content
 
 def save_to_cache(cache_type: str, key: str, data: Any):
     """Save data to cache with timestamp"""
-    ensure_cache_dir()
-    cache_data = {
-        'timestamp': datetime.now().isoformat(),
-        'data': data
-    }
-    with open(get_cache_path(cache_type, key), 'w') as f:
-        json.dump(cache_data, f)
+    save_many_to_cache(cache_type, {key: data})
+
+def save_many_to_cache(cache_type: str, items: Dict[str, Any]):
+    """Save the data of several keys to cache with timestamp, in one transaction"""
+    if not items:
+        return
+    timestamp = datetime.now().timestamp()
+    connection = get_cache_connection()
+    with connection:
+        connection.executemany(
+            "INSERT OR REPLACE INTO cache (type, key, timestamp, data) VALUES (?, ?, ?, ?)",
+            [(cache_type, key, timestamp, _encode_cache_data(data)) for key, data in items.items()]
+        )
+
+def _decode_cache_data(cache_type: str, timestamp: float, content: bytes) -> Optional[Any]:
+    """Decode a cached payload, or return None if it has expired or can't be read"""
+    expire_hours = CACHE_CONFIG[cache_type]['expire_hours']
+    if datetime.now() - datetime.fromtimestamp(timestamp) > timedelta(hours=expire_hours):
+        return None
+        
+    try:
+        if content[:4] == ZSTD_MAGIC:
+            if not ZSTD_AVAILABLE:
+                return None
+            content = zstandard.ZstdDecompressor().decompress(content)
+        return json_loads(content)
+    except CACHE_READ_ERRORS:
+        return None
 
 def load_from_cache(cache_type: str, key: str) -> Optional[Any]:
     """Load data from cache if not expired"""
-    cache_path = get_cache_path(cache_type, key)
-    if not cache_path.exists():
+    try:
+        row = get_cache_connection().execute(
+            "SELECT timestamp, data FROM cache WHERE type = ? AND key = ?", (cache_type, key)
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+    return _decode_cache_data(cache_type, row[0], row[1])
+
+def load_many_from_cache(cache_type: str, keys: List[str]) -> Dict[str, Any]:
+    """Load the not expired data of several keys from cache, with one query per chunk of keys"""
+    cached = {}
+    keys = list(dict.fromkeys(keys))
+    try:
+        connection = get_cache_connection()
+        for i in range(0, len(keys), CACHE_QUERY_CHUNK_SIZE):
+            chunk = keys[i:i + CACHE_QUERY_CHUNK_SIZE]
+            rows = connection.execute(
+                f"SELECT key, timestamp, data FROM cache WHERE type = ? AND key IN ({', '.join('?' * len(chunk))})",
+                (cache_type, *chunk)
+            ).fetchall()
+            for key, timestamp, content in rows:
+                data = _decode_cache_data(cache_type, timestamp, content)
+                if data is not None:
+                    cached[key] = data
+    except sqlite3.Error:
+        pass
+    return cached
+
+def get_dataframe_cache_path(key: str) -> Path:
+    """Get the path of a DataFrame cached as Feather file"""
+    return CACHE_DIR / f"{key}.feather"
+
+def save_dataframe_to_cache(key: str, df: pd.DataFrame):
+    """Save a DataFrame of the entries cache as Feather file, if pyarrow is available"""
+    if not PYARROW_AVAILABLE:
+        return
+    ensure_cache_dir()
+    cache_path = get_dataframe_cache_path(key)
+    # Write to a temporary file first, so readers never see a partially written file
+    temp_path = cache_path.with_name(f"{cache_path.name}.tmp.{os.getpid()}")
+    try:
+        df.to_feather(temp_path)
+        os.replace(temp_path, cache_path)
+    except Exception as e:
+        temp_path.unlink(missing_ok=True)
+        # The sample records in the entries cache remain available
+        print(f"Could not cache DataFrame as Feather file: {str(e)}")
+
+def load_dataframe_from_cache(key: str) -> Optional[pd.DataFrame]:
+    """Load a DataFrame of the entries cache from its Feather file if not expired"""
+    cache_path = get_dataframe_cache_path(key)
+    if not PYARROW_AVAILABLE or not cache_path.exists():
         return None
         
     try:
-        with open(cache_path) as f:
-            cache_data = json.load(f)
-            
-        timestamp = datetime.fromisoformat(cache_data['timestamp'])
-        expire_hours = CACHE_CONFIG[cache_type]['expire_hours']
+        timestamp = datetime.fromtimestamp(cache_path.stat().st_mtime)
+        expire_hours = CACHE_CONFIG['entries']['expire_hours']
         if datetime.now() - timestamp > timedelta(hours=expire_hours):
             return None
             
-        return cache_data['data']
-    except:
+        return pd.read_feather(cache_path)
+    except (OSError, ValueError):
         return None
 
 def clear_cache(cache_type: Optional[str] = None):
     """Clear all cache or specific cache type"""
-    if cache_type:
-        cache_dir = CACHE_DIR / cache_type
-        if cache_dir.exists():
-            for cache_file in cache_dir.glob('*.json'):
-                cache_file.unlink()
-    else:
-        if CACHE_DIR.exists():
-            for cache_type_dir in CACHE_DIR.glob('*'):
-                if cache_type_dir.is_dir():
-                    for cache_file in cache_type_dir.glob('*.json'):
-                        cache_file.unlink()
+    if cache_type in (None, 'users'):
+        _user_details_cache.clear()
+    if cache_type in (None, 'uploads'):
+        _upload_details_cache.clear()
+        
+    if CACHE_DB.exists():
+        connection = get_cache_connection()
+        with connection:
+            if cache_type:
+                connection.execute("DELETE FROM cache WHERE type = ?", (cache_type,))
+            else:
+                connection.execute("DELETE FROM cache")
+    
+    if cache_type in (None, 'entries'):
+        for cache_file in CACHE_DIR.glob('*.feather'):
+            cache_file.unlink()
+    
+    # Remove cache files left from the former one-JSON-file-per-item layout
+    for cache_file in CACHE_DIR.glob(f"{cache_type or '*'}/*.json"):
+        cache_file.unlink()
 
 def get_cache_stats() -> Dict[str, Dict[str, Any]]:
     """Get statistics about the cache"""
     stats = {}
+    if not CACHE_DB.exists():
+        return stats
+        
+    rows = get_cache_connection().execute(
+        "SELECT type, COUNT(*), SUM(LENGTH(data)), MIN(timestamp), MAX(timestamp) FROM cache GROUP BY type"
+    ).fetchall()
+    type_stats = {row[0]: row[1:] for row in rows}
     for cache_type in CACHE_CONFIG.keys():
-        cache_dir = CACHE_DIR / cache_type
-        if cache_dir.exists():
-            files = list(cache_dir.glob('*.json'))
-            total_size = sum(f.stat().st_size for f in files)
-            oldest = min((f.stat().st_mtime for f in files), default=None)
-            newest = max((f.stat().st_mtime for f in files), default=None)
-            
-            stats[cache_type] = {
-                'count': len(files),
-                'size_kb': total_size / 1024,
-                'oldest': datetime.fromtimestamp(oldest).isoformat() if oldest else None,
-                'newest': datetime.fromtimestamp(newest).isoformat() if newest else None
-            }
+        count, total_size, oldest, newest = type_stats.get(cache_type, (0, 0, None, None))
+        stats[cache_type] = {
+            'count': count,
+            'size_kb': total_size / 1024,
+            'oldest': datetime.fromtimestamp(oldest).isoformat() if oldest else None,
+            'newest': datetime.fromtimestamp(newest).isoformat() if newest else None
+        }
     return stats
 
 def get_user_details(client, user_id: str) -> Dict[str, Any]:
@@ -116,7 +290,226 @@ def get_user_details(client, user_id: str) -> Dict[str, Any]:
         print(f"Error getting user details for {user_id}: {str(e)}")
         return {}
 
-def get_hysprint_data(client, max_entries: Optional[int] = 500) -> Optional[pd.DataFrame]:
+def _load_from_details_cache(details_cache: OrderedDict, cache_type: str, keys: List[str]) -> Dict[str, Any]:
+    """Look up the not expired items of an in-memory details cache, dropping expired ones"""
+    found = {}
+    expire_after = timedelta(hours=CACHE_CONFIG[cache_type]['expire_hours'])
+    with _details_cache_lock:
+        for key in keys:
+            cached = details_cache.get(key)
+            if cached is None:
+                continue
+            if datetime.now() - cached[0] > expire_after:
+                del details_cache[key]
+                continue
+            details_cache.move_to_end(key)
+            found[key] = cached[1]
+    return found
+
+def _save_to_details_cache(details_cache: OrderedDict, items: Dict[str, Any]):
+    """Add items to an in-memory details cache, evicting the least recently used beyond DETAILS_CACHE_MAXSIZE"""
+    timestamp = datetime.now()
+    with _details_cache_lock:
+        for key, value in items.items():
+            details_cache[key] = (timestamp, value)
+            details_cache.move_to_end(key)
+        while len(details_cache) > DETAILS_CACHE_MAXSIZE:
+            details_cache.popitem(last=False)
+
+def _load_uploads_details(upload_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Look up upload details in the in-memory and disk uploads caches, omitting uploads not cached"""
+    uploads = _load_from_details_cache(_upload_details_cache, 'uploads', upload_ids)
+    
+    # Read all uploads missing from memory from the disk cache at once
+    missing_ids = [upload_id for upload_id in upload_ids if upload_id not in uploads]
+    cached_uploads = load_many_from_cache('uploads', [f"upload_{upload_id}" for upload_id in missing_ids])
+    cached_uploads = {upload_id: cached_uploads[f"upload_{upload_id}"] for upload_id in missing_ids
+                      if f"upload_{upload_id}" in cached_uploads}
+    _save_to_details_cache(_upload_details_cache, cached_uploads)
+    uploads.update(cached_uploads)
+    return uploads
+
+def _store_uploads_details(uploads: Dict[str, Dict[str, Any]]):
+    """Store upload details by upload ID in the in-memory and disk uploads caches"""
+    save_many_to_cache('uploads', {f"upload_{upload_id}": upload_data for upload_id, upload_data in uploads.items()})
+    _save_to_details_cache(_upload_details_cache, uploads)
+
+def _fetch_upload_details(client, upload_id: str) -> Dict[str, Any]:
+    """Request upload details from NOMAD API, bypassing the uploads cache"""
+    upload_response = client.make_request("get", f"uploads/{upload_id}")
+    return upload_response.get('data', {})
+
+def get_upload_details(client, upload_id: str) -> Dict[str, Any]:
+    """
+    Get upload details from NOMAD API, using the uploads cache
+    
+    Parameters:
+    -----------
+    client: NomadClient
+        Authenticated NOMAD API client
+    upload_id: str
+        Upload ID to look up
+        
+    Returns:
+    --------
+    dict
+        Upload details including upload name, main author, creation time, etc.
+    """
+    upload_data = _load_uploads_details([upload_id]).get(upload_id)
+    if upload_data is None:
+        upload_data = _fetch_upload_details(client, upload_id)
+        _store_uploads_details({upload_id: upload_data})
+    return upload_data
+
+def get_uploads_details(client, upload_ids: List[str], max_workers: int = MAX_WORKERS) -> Dict[str, Dict[str, Any]]:
+    """
+    Get details of several uploads, using the uploads cache
+    
+    Uploads missing from the cache are requested in batches through the uploads
+    endpoint; only those it does not list are fetched one by one. All fetched
+    uploads are then stored in the cache at once.
+    
+    Parameters:
+    -----------
+    client: NomadClient
+        Authenticated NOMAD API client
+    upload_ids: list
+        Upload IDs to look up
+    max_workers: int
+        Maximum number of concurrent requests for uploads fetched one by one
+        
+    Returns:
+    --------
+    dict
+        Upload details by upload ID
+    """
+    uploads = _load_uploads_details(upload_ids)
+    missing_ids = [upload_id for upload_id in upload_ids if upload_id not in uploads]
+    
+    if missing_ids:
+        fetched = list_uploads_by_id(client, missing_ids)
+        try:
+            # Fall back to one request per upload for the uploads not listed; the workers only
+            # request, the cache is written from this thread
+            remaining_ids = [upload_id for upload_id in missing_ids if upload_id not in fetched]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                fetched.update(zip(remaining_ids, tqdm(
+                    executor.map(lambda upload_id: _fetch_upload_details(client, upload_id), remaining_ids),
+                    desc="Fetching uploads", total=len(remaining_ids), unit="upload",
+                    mininterval=0.5, miniters=max(1, len(remaining_ids) // 100)
+                )))
+        finally:
+            # Keep the uploads fetched before a failed request
+            _store_uploads_details(fetched)
+        uploads.update(fetched)
+    return uploads
+
+def _load_authors_details(author_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Look up author details in the in-memory and disk users caches, omitting authors not cached"""
+    authors = _load_from_details_cache(_user_details_cache, 'users', author_ids)
+    
+    # Read all authors missing from memory from the disk cache at once
+    cached_authors = load_many_from_cache('users', [author_id for author_id in author_ids if author_id not in authors])
+    _save_to_details_cache(_user_details_cache, cached_authors)
+    authors.update(cached_authors)
+    return authors
+
+def _store_authors_details(authors: Dict[str, Dict[str, Any]]):
+    """Store author details by author ID in the in-memory and disk users caches"""
+    save_many_to_cache('users', authors)
+    _save_to_details_cache(_user_details_cache, authors)
+
+def get_authors_details(client, author_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Get user details of several authors, using the users cache
+    
+    Authors missing from the cache are requested in batches through the users
+    endpoint instead of one request per author.
+    
+    Parameters:
+    -----------
+    client: NomadClient
+        Authenticated NOMAD API client
+    author_ids: list
+        User IDs of the authors
+        
+    Returns:
+    --------
+    dict
+        User details by author ID (empty for authors that could not be found)
+    """
+    authors = _load_authors_details(author_ids)
+    missing_ids = [author_id for author_id in author_ids if author_id not in authors]
+    
+    if missing_ids:
+        fetched = get_users_details(client, missing_ids)
+        fetched = {author_id: fetched.get(author_id, {}) for author_id in missing_ids}
+        _store_authors_details(fetched)
+        authors.update(fetched)
+    return authors
+
+def samples_to_dataframe(samples_data: Union[List[Dict[str, Any]], Dict[str, List[Any]], pd.DataFrame]) -> pd.DataFrame:
+    """
+    Convert sample data into the HySprint samples DataFrame
+    
+    The columns are fixed to SAMPLE_COLUMNS, so pandas does not need to infer them
+    from the records. The upload date is kept as a datetime64 column holding the
+    (timezone-naive) date; format it only for display with format_date. The
+    repeating author IDs and upload names are stored as categorical columns and
+    the solar cell values as float32; convert a categorical column with
+    .astype(str) before assigning values that are not among its categories.
+    
+    Parameters:
+    -----------
+    samples_data: list, dict or pandas.DataFrame
+        Sample dictionaries, a dictionary of column lists, or a DataFrame, with the
+        keys in SAMPLE_COLUMNS
+        
+    Returns:
+    --------
+    pandas.DataFrame
+        DataFrame containing HySprint sample data
+    """
+    if isinstance(samples_data, pd.DataFrame):
+        df = samples_data.reindex(columns=SAMPLE_COLUMNS).reset_index(drop=True)
+    elif isinstance(samples_data, dict):
+        df = pd.DataFrame(samples_data).reindex(columns=SAMPLE_COLUMNS)
+    else:
+        df = pd.DataFrame.from_records(samples_data, columns=SAMPLE_COLUMNS)
+    if not pd.api.types.is_datetime64_any_dtype(df['upload_date']):
+        # NOMAD timestamps are ISO 8601 in UTC, so the date is given by their first ten characters
+        df['upload_date'] = pd.to_datetime(df['upload_date'].astype(str).str[:10], format='%Y-%m-%d', errors='coerce')
+    df[['main_author_id', 'upload_name']] = df[['main_author_id', 'upload_name']].astype('category')
+    df[['cell_area', 'efficiency']] = df[['cell_area', 'efficiency']].astype('float32')
+    return df
+
+def format_date(dates: pd.Series, date_format: str = '%Y-%m-%d') -> pd.Series:
+    """
+    Format a datetime64 column, such as upload_date, as strings for display
+    
+    Parameters:
+    -----------
+    dates: pandas.Series
+        Dates to format
+    date_format: str
+        strftime format of the resulting strings
+        
+    Returns:
+    --------
+    pandas.Series
+        Formatted dates, with an empty string for missing dates
+    """
+    return pd.to_datetime(dates).dt.strftime(date_format).fillna('')
+
+def _is_invalid_request(error: Exception) -> bool:
+    """Check whether a failed API request was rejected as invalid (HTTP 400 or 422)"""
+    response = getattr(error.__cause__, 'response', None)
+    return getattr(response, 'status_code', None) in (400, 422)
+
+def get_hysprint_data(client, max_entries: Optional[int] = 500, *,
+                      user_cache: Optional[Dict[str, Dict[str, Any]]] = None,
+                      upload_cache: Optional[Dict[str, Dict[str, Any]]] = None,
+                      max_workers: int = MAX_WORKERS) -> Optional[pd.DataFrame]:
     """
     Retrieve HySprint sample data from NOMAD with caching
     
@@ -126,6 +519,14 @@ def get_hysprint_data(client, max_entries: Optional[int] = 500) -> Optional[pd.D
         Authenticated NOMAD API client
     max_entries: Optional[int]
         Maximum number of entries to retrieve, None to retrieve all available entries
+    user_cache: Optional[dict]
+        Author details by user ID; filled in place with the authors looked up.
+        Pass the same dictionary to later calls to skip already resolved authors
+    upload_cache: Optional[dict]
+        Upload details by upload ID; filled in place with the uploads looked up.
+        Pass the same dictionary to later calls to skip already fetched uploads
+    max_workers: int
+        Maximum number of concurrent API requests
         
     Returns:
     --------
@@ -133,15 +534,23 @@ def get_hysprint_data(client, max_entries: Optional[int] = 500) -> Optional[pd.D
         DataFrame containing HySprint sample data
     """
     try:
-        # Try to load from cache first
+        # Try to load from cache first, preferring the DataFrame itself over the sample records
         cache_key = f"hysprint_data_{max_entries}"
+        cached_df = load_dataframe_from_cache(cache_key)
+        if cached_df is not None:
+            print("Loading data from cache...")
+            return samples_to_dataframe(cached_df)
+        
         cached_data = load_from_cache('entries', cache_key)
         if cached_data is not None:
             print("Loading data from cache...")
-            return pd.DataFrame(cached_data)
+            return samples_to_dataframe(cached_data)
 
         print(f"Retrieving {'all' if max_entries is None else f'up to {max_entries}'} HySprint samples...")
         
+        # Use large pages, or smaller ones if fewer entries are requested
+        page_size = PAGE_SIZE if max_entries is None else max(1, min(PAGE_SIZE, max_entries))
+        
         # First try with admin access, then fall back to visible
         access_levels = ["admin", "visible"]
         query_payload = None
@@ -157,14 +566,24 @@ def get_hysprint_data(client, max_entries: Optional[int] = 500) -> Optional[pd.D
                             {"quantities:all": ["data"]},
                         ]
                     },
+                    # Only return the entry fields used for the samples DataFrame
+                    "required": {"include": list(ENTRY_FIELDS)},
                     "pagination": {
-                        "page_size": 100,  # Always use maximum page size allowed
+                        "page_size": page_size,
                         "page": 1
                     }
                 }
                 
                 print(f"Trying to retrieve samples with {access_level} access...")
-                response = client.make_request("post", "entries/query", json_data=query_payload)
+                try:
+                    response = client.make_request("post", "entries/query", json_data=query_payload)
+                except ConnectionError as e:
+                    if page_size <= FALLBACK_PAGE_SIZE or not _is_invalid_request(e):
+                        raise
+                    print(f"Page size {page_size} not accepted, retrying with {FALLBACK_PAGE_SIZE}...")
+                    page_size = FALLBACK_PAGE_SIZE
+                    query_payload["pagination"]["page_size"] = page_size
+                    response = client.make_request("post", "entries/query", json_data=query_payload)
                 if response:
                     print(f"Successfully retrieved samples with {access_level} access")
                     break
@@ -183,94 +602,78 @@ def get_hysprint_data(client, max_entries: Optional[int] = 500) -> Optional[pd.D
         total_entries = response.get('pagination', {}).get('total', 0)
         print(f"Found {total_entries} total entries")
         
-        # Calculate total pages needed
-        total_pages = (total_entries + 99) // 100  # Ceiling division
+        # Calculate total pages needed, stopping at the last page that contains requested entries
+        total_pages = (total_entries + page_size - 1) // page_size  # Ceiling division
         if max_entries is not None:
-            total_pages = min((max_entries + 99) // 100, total_pages)
-        
-        # If max_entries is None, retrieve all entries
-        all_entries = entries.copy()
+            total_pages = min((max_entries + page_size - 1) // page_size, total_pages)
         
         # Only fetch additional pages if needed
+        pages = [entries]
         if total_pages > 1:
             print(f"Fetching data pages:")
-            # Create progress bar for page fetching
-            for page in tqdm(range(2, total_pages + 1), desc="Fetching pages", total=total_pages-1, unit="page"):
-                query_payload["pagination"]["page"] = page
-                response = client.make_request("post", "entries/query", json_data=query_payload)
-                if response and 'data' in response:
-                    page_entries = response['data']
-                    all_entries.extend(page_entries)
-                    if max_entries is not None and len(all_entries) >= max_entries:
-                        all_entries = all_entries[:max_entries]
-                        break
-                        
-        entries = all_entries
+            
+            def fetch_page(page: int) -> List[Dict[str, Any]]:
+                payload = {**query_payload, "pagination": {**query_payload["pagination"], "page": page}}
+                # Only the entries are needed from later pages, so skip decoding the rest of the response
+                return list(client.make_request_stream("post", "entries/query", json_data=payload))
+            
+            # Pages are independent, so fetch them concurrently; map keeps them in page order
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Create progress bar for page fetching, redrawn at most every 1% and 0.5 seconds
+                pages.extend(tqdm(executor.map(fetch_page, range(2, total_pages + 1)),
+                                  desc="Fetching pages", total=total_pages-1, unit="page",
+                                  mininterval=0.5, miniters=max(1, (total_pages - 1) // 100)))
+        
+        # Concatenate all pages once, stopping at max_entries (None keeps all entries)
+        entries = list(itertools.islice(itertools.chain.from_iterable(pages), max_entries))
+        
         print(f"Retrieved {len(entries)} entries. Now processing author details...")
         
-        # Cache for user details to avoid repeated API calls
-        user_cache = {}
-        
-        # Process entries into a list of dictionaries
-        samples_data = []
-        print("Processing author details for each sample:")
-        for entry in tqdm(entries, desc="Processing samples", total=len(entries), unit="sample"):
-            # Get upload details to get author information
-            upload_id = entry.get('upload_id')
-            if upload_id:
-                # Try to get upload details from cache
-                upload_cache_key = f"upload_{upload_id}"
-                upload_data = load_from_cache('uploads', upload_cache_key)
-                
-                if upload_data is None:
-                    upload_response = client.make_request("get", f"uploads/{upload_id}")
-                    upload_data = upload_response.get('data', {})
-                    # Cache the upload data
-                    save_to_cache('uploads', upload_cache_key, upload_data)
-                
-                # Get upload name
-                upload_name = upload_data.get('upload_name', '')
-                
-                # Get author details
-                author_id = upload_data.get('main_author', '')
-                if author_id:
-                    # Try to get author details from cache
-                    author_info = load_from_cache('users', author_id)
-                    if author_info is None and author_id not in user_cache:
-                        author_info = get_user_details(client, author_id)
-                        user_cache[author_id] = author_info
-                        # Cache the author data
-                        save_to_cache('users', author_id, author_info)
-                    elif author_id in user_cache:
-                        author_info = user_cache[author_id]
-                else:
-                    author_info = {}
-                
-                author_name = author_info.get('name', author_info.get('username', author_id))
-                
-                # Extract sample data
-                sample_info = {
-                    'upload_id': upload_id,
-                    'upload_name': upload_name,
-                    'sample_name': entry.get('data', {}).get('name', ''),
-                    'lab_id': entry.get('data', {}).get('lab_id', ''),
-                    'upload_date': upload_data.get('upload_create_time', ''),
-                    'main_author_id': author_id,
-                    'main_author': author_name,
-                    'cell_area': entry.get('results', {}).get('properties', {}).get('optoelectronic', {}).get('solar_cell', {}).get('cell_area', 0.0),
-                    'efficiency': entry.get('results', {}).get('properties', {}).get('optoelectronic', {}).get('solar_cell', {}).get('efficiency', 0.0)
-                }
-                samples_data.append(sample_info)
+        user_cache = user_cache if user_cache is not None else {}
+        upload_cache = upload_cache if upload_cache is not None else {}
+        
+        # Many entries share an upload, so fetch each distinct upload only once
+        unique_upload_ids = list({entry['upload_id'] for entry in entries if entry.get('upload_id')})
+        missing_upload_ids = [upload_id for upload_id in unique_upload_ids if upload_id not in upload_cache]
+        
+        # Get upload details (which contain the author information) in batches
+        print("Fetching upload details:")
+        upload_cache.update(get_uploads_details(client, missing_upload_ids, max_workers))
+        
+        # Then get the details of every distinct main author not resolved yet in batches
+        author_ids = {upload_cache[upload_id].get('main_author', '') for upload_id in unique_upload_ids} - {''}
+        user_cache.update(get_authors_details(client, [author_id for author_id in author_ids
+                                                       if author_id not in user_cache]))
         
-        # Convert to DataFrame
-        df = pd.DataFrame(samples_data)
+        # Flatten all entries in one pass and keep only the fields we need
+        print("Processing sample data...")
+        samples = pd.json_normalize(entries).reindex(columns=list(ENTRY_FIELDS)).rename(columns=ENTRY_FIELDS)
+        samples = samples[samples['upload_id'].notna() & (samples['upload_id'] != '')]
+        samples = samples.fillna({'sample_name': '', 'lab_id': '', 'cell_area': 0.0, 'efficiency': 0.0})
         
-        # Convert dates to datetime
-        if 'upload_date' in df.columns:
-            df['upload_date'] = pd.to_datetime(df['upload_date']).dt.strftime('%Y-%m-%d')
+        # Add upload and author information, building one row per distinct upload and joining it
+        upload_info = pd.DataFrame.from_dict(
+            {
+                upload_id: (upload.get('upload_name', ''), upload.get('upload_create_time', ''),
+                            upload.get('main_author', ''))
+                for upload_id, upload in upload_cache.items()
+            },
+            orient='index', columns=['upload_name', 'upload_date', 'main_author_id']
+        )
+        samples = samples.join(upload_info, on='upload_id')
+        author_names = pd.Series({
+            author_id: author_info.get('name', author_info.get('username', author_id))
+            for author_id, author_info in user_cache.items()
+        }, dtype=object)
+        samples['main_author'] = samples['main_author_id'].map(author_names).fillna(samples['main_author_id'])
+        
+        # Cache the samples column by column rather than as one dictionary per sample
+        samples_data = samples.reindex(columns=SAMPLE_COLUMNS).to_dict('list')
+        df = samples_to_dataframe(samples)
         
         # Cache the processed data
         save_to_cache('entries', cache_key, samples_data)
+        save_dataframe_to_cache(cache_key, df)
             
         print(f"Processing complete. Retrieved {len(df)} samples.")
         return df
@@ -318,50 +721,31 @@ def load_attributions(filename: str = 'attribution_overrides.csv') -> Dict[str,
             print(f"Attribution file {filename} not found. Starting with empty attributions.")
             return attributions
             
-        # Remove comment lines before parsing with pandas
-        with open(filename, 'r') as f:
-            lines = f.readlines()
-        
-        # Filter out comment lines
-        data_lines = [line for line in lines if not line.strip().startswith('#')]
+        # Parse the CSV rows, skipping comment lines
+        with open(filename, 'r', newline='') as f:
+            reader = csv.DictReader(line for line in f if not line.strip().startswith('#'))
+            rows = list(reader)
+            columns = reader.fieldnames
         
-        if not data_lines:
+        if not columns:
             print(f"No data found in attribution file {filename}.")
             return attributions
             
-        # Write filtered content to a temporary file
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp:
-            temp_filename = temp.name
-            temp.writelines(data_lines)
+        if 'upload_id' in columns:
+            today = datetime.now().strftime('%Y-%m-%d')
+            # Handle the author ID/name fields (with backwards compatibility for legacy field names)
+            author_id_column = 'author_id' if 'author_id' in columns else 'main_author' if 'main_author' in columns else None
+            display_name_column = ('author_display_name' if 'author_display_name' in columns
+                                   else 'main_author_name' if 'main_author_name' in columns
+                                   else author_id_column)  # Fallback to ID if no name is available
             
-        # Load the filtered CSV
-        df = pd.read_csv(temp_filename)
-        
-        # Clean up the temporary file
-        os.unlink(temp_filename)
-            
-        # Convert to dictionary with improved field names
-        for _, row in df.iterrows():
-            if 'upload_id' in row:
-                attribution_data = {
-                    'override_date': row.get('override_date', datetime.now().strftime('%Y-%m-%d'))
-                }
-                
-                # Handle the author ID/name fields (with backwards compatibility)
-                if 'author_id' in row:
-                    attribution_data['author_id'] = row['author_id']
-                elif 'main_author' in row:  # Legacy field name
-                    attribution_data['author_id'] = row['main_author']
-                
-                # Handle the display name field (with backwards compatibility)
-                if 'author_display_name' in row:
-                    attribution_data['author_display_name'] = row['author_display_name']
-                elif 'main_author_name' in row:  # Legacy field name
-                    attribution_data['author_display_name'] = row['main_author_name']
-                elif 'author_id' in attribution_data:  # Fallback to ID if no name is available
-                    attribution_data['author_display_name'] = attribution_data['author_id']
-                    
+            # Convert to dictionary with improved field names
+            for row in rows:
+                attribution_data = {'override_date': row.get('override_date') or today}
+                if author_id_column:
+                    attribution_data['author_id'] = row[author_id_column]
+                if display_name_column:
+                    attribution_data['author_display_name'] = row[display_name_column]
                 attributions[row['upload_id']] = attribution_data
                 
         print(f"Loaded {len(attributions)} attribution overrides")
@@ -394,32 +778,21 @@ def save_attributions(attributions: Dict[str, Dict[str, str]], filename: str = '
         # Import os here to ensure it's available
         import os
         
-        # Convert to DataFrame with improved field names
-        data = []
-        for upload_id, attr_info in attributions.items():
-            # Handle both the new field names and legacy field names
-            author_id = attr_info.get('author_id', attr_info.get('main_author', ''))
-            author_display_name = attr_info.get('author_display_name', 
-                                      attr_info.get('main_author_name', author_id))
-            
-            data.append({
-                'upload_id': upload_id,
-                'author_id': author_id,
-                'author_display_name': author_display_name,
-                'override_date': attr_info.get('override_date', datetime.now().strftime('%Y-%m-%d'))
-            })
-            
-        df = pd.DataFrame(data)
-        
-        # Add a comment header to the CSV file
-        header_comment = "# NOMAD Sample Attribution Overrides\n# This file contains manual corrections to sample attributions.\n"
-        
-        # Write the header comment first
-        with open(filename, 'w') as f:
-            f.write(header_comment)
-        
-        # Then append the CSV data
-        df.to_csv(filename, index=False, mode='a')
+        # Add a comment header to the CSV file, followed by the CSV data with improved field names
+        with open(filename, 'w', newline='') as f:
+            f.write("# NOMAD Sample Attribution Overrides\n# This file contains manual corrections to sample attributions.\n")
+            writer = csv.DictWriter(f, fieldnames=ATTRIBUTION_COLUMNS, lineterminator='\n')
+            writer.writeheader()
+            for upload_id, attr_info in attributions.items():
+                # Handle both the new field names and legacy field names
+                author_id = attr_info.get('author_id', attr_info.get('main_author', ''))
+                writer.writerow({
+                    'upload_id': upload_id,
+                    'author_id': author_id,
+                    'author_display_name': attr_info.get('author_display_name',
+                                                         attr_info.get('main_author_name', author_id)),
+                    'override_date': attr_info.get('override_date', datetime.now().strftime('%Y-%m-%d'))
+                })
         
         print(f"Saved {len(attributions)} attribution overrides to {filename}")
         